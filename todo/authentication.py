@@ -0,0 +1,16 @@
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+
+class OptionalTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication which treats a bad or revoked token as anonymous.
+
+    Used where credentials in the request body can still authenticate the
+    user, so a stale token header must not reject the request outright.
+    """
+    def authenticate(self, request):
+        try:
+            return super().authenticate(request)
+        except AuthenticationFailed:
+            return None
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.4 on 2026-10-15 10:10
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicate_categories(apps, schema_editor):
+    """
+    Fold categories sharing a user and name into the oldest one, so the
+    unique (user, name) constraint in the next migration can be added.
+    """
+    Category = apps.get_model('todo', 'Category')
+    Task = apps.get_model('todo', 'Task')
+
+    duplicates = (
+        Category.objects.values('user', 'name')
+        .annotate(count=Count('id'), keep=Min('id'))
+        .filter(count__gt=1)
+    )
+    for group in duplicates:
+        extra = Category.objects.filter(user=group['user'], name=group['name']).exclude(id=group['keep'])
+        Task.objects.filter(category__in=extra).update(category_id=group['keep'])
+        extra.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0002_category_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_categories, migrations.RunPython.noop),
+    ]
@@ -5,6 +5,10 @@ from django.contrib.auth.models import User
 class Category(models.Model):
     name = models.CharField(max_length=50)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'name')
 
     def __str__(self):
         return self.name
@@ -24,6 +28,13 @@ class Task(models.Model):
     due_date = models.DateTimeField(null=True, blank=True)
     completed = models.BooleanField(default=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'category'], name='todo_task_user_category_idx'),
+            models.Index(fields=['user', 'priority'], name='todo_task_user_priority_idx'),
+        ]
 
     def __str__(self):
         return self.title
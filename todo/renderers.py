@@ -0,0 +1,42 @@
+import orjson
+from django.utils.functional import Promise
+from django.utils.http import parse_header_parameters
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    # lazy translation strings are the only non-native type the app returns;
+    # anything else is a bug and should fail like DRF's JSONEncoder does
+    if isinstance(obj, Promise):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer which serializes to JSON using orjson.
+
+    Compact output matches DRF's JSONRenderer for the data this app returns,
+    including UTC datetimes ending in 'Z'. orjson only supports two-space
+    indentation, so any requested indent is rendered with two spaces.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        if accepted_media_type:
+            _, params = parse_header_parameters(accepted_media_type)
+            try:
+                return int(params['indent'])
+            except (KeyError, ValueError):
+                pass
+        return (renderer_context or {}).get('indent')
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_UTC_Z
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
@@ -1,18 +1,42 @@
+from copy import copy
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from .models import Task, Category
 from django.contrib.auth.password_validation import validate_password
-from rest_framework.authtoken.models import Token
-from rest_framework.exceptions import AuthenticationFailed
 
 
-class TaskSerializer(serializers.ModelSerializer):
+_VALID_PRIORITIES = frozenset(('low', 'medium', 'high'))
+
+
+# field maps built by ModelSerializer.get_fields, keyed by serializer class
+_fields_cache = {}
+
+
+class CachedFieldsMixin:
+    """
+    Build the model field map once per serializer class and reuse it.
+
+    ModelSerializer introspects the model on every instantiation, which adds
+    up on list endpoints. Each instance gets shallow copies of the cached
+    fields, since DRF binds fields to their parent serializer.
+    """
+    def get_fields(self):
+        cached = _fields_cache.get(type(self))
+        if cached is None:
+            cached = _fields_cache[type(self)] = super().get_fields()
+        return {name: copy(field) for name, field in cached.items()}
+
+
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for task listing and creation.
     """
     class Meta:
         model = Task
-        fields = '__all__'
+        fields = ('id', 'title', 'description', 'priority', 'category', 'due_date', 'completed')
 
     def to_representation(self, instance):
         return {
@@ -26,23 +50,24 @@ class TaskSerializer(serializers.ModelSerializer):
         }
 
 
-class TaskCreateSerializer(serializers.ModelSerializer):
+class TaskCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for task listing and creation.
     """
     class Meta:
         model = Task
-        fields = '__all__'
+        fields = ('id', 'title', 'description', 'priority', 'category', 'due_date', 'completed')
 
     def validate_category(self, value):
-        # check if category exists for the user
-        if not Category.objects.filter(user=self.context['request'].user, name=value).exists():
+        # value is the Category already loaded by the primary key field,
+        # so check that it belongs to the user without querying again
+        if value.user_id != self.context['request'].user.id:
             raise serializers.ValidationError('This category does not exist.')
         return value
 
     def validate_priority(self, value):
         # check if priority is valid
-        if value not in ['low', 'medium', 'high']:
+        if value not in _VALID_PRIORITIES:
             raise serializers.ValidationError('Invalid priority.')
         return value
 
@@ -52,34 +77,29 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('This task already exists.')
         return data
 
-    def to_representation(self, instance):
-        return {
-            'id': instance.id,
-            'title': instance.title,
-            'description': instance.description,
-            'priority': instance.priority,
-            'category': instance.category.name,
-            'due_date': instance.due_date,
-            'completed': instance.completed
-        }
+    # same fixed-shape output as the listing serializer
+    to_representation = TaskSerializer.to_representation
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for category listing.
     """
     class Meta:
         model = Category
-        fields = '__all__'
+        fields = ('id', 'name')
 
     def create(self, validated_data):
-        # check if category already exists for the user
-        if Category.objects.filter(user=validated_data['user'], name=validated_data['name']).exists():
+        # the unique (user, name) constraint rejects duplicates, so insert
+        # directly instead of checking beforehand
+        try:
+            with transaction.atomic():
+                category = Category.objects.create(
+                    user=validated_data['user'],
+                    name=validated_data['name']
+                )
+        except IntegrityError:
             raise serializers.ValidationError('This category already exists.')
-        category = Category.objects.create(
-            user=validated_data['user'],
-            name=validated_data['name']
-        )
         return category
 
     def to_representation(self, instance):
@@ -89,6 +109,14 @@ class CategorySerializer(serializers.ModelSerializer):
         }
 
 
+class TaskFilterSerializer(serializers.Serializer):
+    """
+    Serializer for task list query parameters.
+    """
+    # ids outside the BigAutoField range can never match a category
+    category_id = serializers.IntegerField(min_value=1, max_value=2 ** 63 - 1, required=False, allow_null=True)
+
+
 class UserRegisterSerializer(serializers.Serializer):
     """
     Serializer for user registration.
@@ -97,25 +125,36 @@ class UserRegisterSerializer(serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
-    def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError('This username is already taken.')
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('This email is already registered.')
-        return value
-
     def validate_password(self, value):
         # Used Django's built-in password validation
         validate_password(value)
         return value
 
+    def validate(self, data):
+        # check username and email clashes in a single query
+        clashes = User.objects.filter(
+            Q(username=data['username']) | Q(email=data['email'])
+        ).values_list('username', 'email')
+        errors = {}
+        for username, email in clashes:
+            if username == data['username']:
+                errors['username'] = 'This username is already taken.'
+            if email == data['email']:
+                errors['email'] = 'This email is already registered.'
+        if errors:
+            raise serializers.ValidationError(errors)
+        return data
+
     def create(self, validated_data):
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password']
-        )
+        # validate() can race with a concurrent registration, so the unique
+        # username constraint has the final say
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['username'],
+                    email=validated_data['email'],
+                    password=validated_data['password']
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({'username': 'This username is already taken.'})
         return user
@@ -1,3 +1,224 @@
-from django.test import TestCase
+import json
+from datetime import datetime, timezone
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.relations import HyperlinkedRelatedField, ManyRelatedField
+from rest_framework.test import APITestCase
+
+from .models import Task, Category
+from .renderers import ORJSONRenderer
+from .serializers import (
+    UserRegisterSerializer,
+    CategorySerializer,
+    TaskSerializer, TaskCreateSerializer,
+)
+
+
+class SerializerFieldsTests(SimpleTestCase):
+    """
+    Hyperlinked fields call reverse() for every object, which makes list
+    responses grow linearly in URL resolution cost, so the app's serializers
+    stick to primary key fields.
+    """
+
+    def test_no_hyperlinked_fields(self):
+        for serializer_class in (TaskSerializer, TaskCreateSerializer, CategorySerializer, UserRegisterSerializer):
+            for name, field in serializer_class().get_fields().items():
+                if isinstance(field, ManyRelatedField):
+                    field = field.child_relation
+                with self.subTest(serializer=serializer_class.__name__, field=name):
+                    # HyperlinkedIdentityField is a subclass, so this covers both
+                    self.assertNotIsInstance(field, HyperlinkedRelatedField)
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    The orjson renderer must stay interchangeable with DRF's JSONRenderer.
+    """
+    data = {
+        'id': 1,
+        'title': 'café',
+        'due_date': datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        'completed': False,
+        'tags': [None, 1.5],
+    }
+
+    def test_matches_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_indent(self):
+        for media_type, context in (('application/json; indent=4', None), ('application/json', {'indent': 4})):
+            with self.subTest(media_type=media_type, context=context):
+                content = ORJSONRenderer().render(self.data, media_type, context)
+                self.assertIn(b'\n  "id"', content)
+                self.assertEqual(json.loads(content), json.loads(JSONRenderer().render(self.data)))
+
+    def test_unknown_types_raise(self):
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render({'value': object()})
+
+
+class TaskAPITestCase(APITestCase):
+    """
+    Base for tests acting as a token-authenticated user with one category and task.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret-pass-123')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+        self.category = Category.objects.create(user=self.user, name='work')
+        self.task = Task.objects.create(user=self.user, category=self.category, title='report', description='', priority='high')
+
+
+class TaskListFilterTests(TaskAPITestCase):
+    """
+    Filtering the task list by category id, category name and priority.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.year = Category.objects.create(user=self.user, name='2024')
+        Task.objects.create(user=self.user, category=self.year, title='taxes', description='', priority='low')
+
+    def get_tasks(self, **params):
+        response = self.client.get(reverse('task-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(b''.join(response.streaming_content))
+
+    def titles(self, **params):
+        return sorted(task['title'] for task in self.get_tasks(**params))
+
+    def test_filter_by_category_id(self):
+        self.assertEqual(self.titles(category_id=self.category.id), ['report'])
+
+    def test_filter_by_category_name(self):
+        self.assertEqual(self.titles(category='work'), ['report'])
+
+    def test_filter_by_numeric_category_name(self):
+        self.assertEqual(self.titles(category='2024'), ['taxes'])
+
+    def test_filter_by_priority(self):
+        self.assertEqual(self.titles(priority='low'), ['taxes'])
+
+    def test_filters_are_exact(self):
+        self.assertEqual(self.titles(category='wor'), [])
+        self.assertEqual(self.titles(priority='HIGH'), [])
+
+    def test_invalid_category_id(self):
+        for value in ('²', '-1', 'abc', '99999999999999999999999', '9' * 5000):
+            with self.subTest(category_id=value):
+                response = self.client.get(reverse('task-list'), {'category_id': value})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_zero_padded_category_id(self):
+        self.assertEqual(self.titles(category_id=str(self.category.id).zfill(25)), ['report'])
+
+    def test_empty_category_id_is_ignored(self):
+        self.assertEqual(self.titles(category_id=''), ['report', 'taxes'])
+
+    def test_largest_category_id_matches_nothing(self):
+        self.assertEqual(self.titles(category_id=2 ** 63 - 1), [])
+
+
+class ListETagTests(TaskAPITestCase):
+    """
+    Conditional GETs on the task and category lists.
+    """
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response['ETag']
+
+    def assertNotModified(self, url, if_none_match):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=if_none_match)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_matching_etag_returns_304(self):
+        for url in (reverse('task-list'), reverse('category-list')):
+            with self.subTest(url=url):
+                etag = self.etag(url)
+                self.assertNotModified(url, etag)
+                self.assertNotModified(url, f'W/{etag}')
+                self.assertNotModified(url, '*')
+
+    def test_etag_depends_on_format(self):
+        url = reverse('category-list')
+        etag = self.etag(url)
+        response = self.client.get(url, HTTP_ACCEPT='text/html', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('Accept', response['Vary'])
+
+    def test_task_list_etag_changes_after_put(self):
+        url = reverse('task-list')
+        etag = self.etag(url)
+        response = self.client.put(reverse('task-detail', args=[self.task.id]), {
+            'title': 'report', 'description': 'quarterly', 'priority': 'high', 'category': self.category.id,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(self.etag(url), etag)
+
+    def test_task_list_etag_changes_after_delete(self):
+        Task.objects.create(user=self.user, category=self.category, title='slides', description='', priority='low')
+        url = reverse('task-list')
+        etag = self.etag(url)
+        response = self.client.delete(reverse('task-detail', args=[self.task.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(self.etag(url), etag)
+
+    def test_etags_change_after_category_rename(self):
+        task_etag = self.etag(reverse('task-list'))
+        category_etag = self.etag(reverse('category-list'))
+        self.category.name = 'office'
+        self.category.save()
+        self.assertNotEqual(self.etag(reverse('task-list')), task_etag)
+        self.assertNotEqual(self.etag(reverse('category-list')), category_etag)
+
+
+class LoginTests(APITestCase):
+    """
+    Logging in with credentials, a token, or both.
+    """
+
+    def setUp(self):
+        self.alice = User.objects.create_user(username='alice', password='alice-pass-123')
+        self.bob = User.objects.create_user(username='bob', password='bob-pass-123')
+        self.alice_token = Token.objects.create(user=self.alice)
+
+    def login(self, token=None, **credentials):
+        if token:
+            self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        return self.client.post(reverse('login'), credentials, format='json')
+
+    def test_credentials(self):
+        response = self.login(username='alice', password='alice-pass-123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['token'], self.alice_token.key)
+
+    def test_token_without_credentials(self):
+        response = self.login(self.alice_token.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['token'], self.alice_token.key)
+
+    def test_token_with_wrong_password(self):
+        response = self.login(self.alice_token.key, username='alice', password='wrong')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn('token', response.data)
+
+    def test_token_with_other_users_credentials(self):
+        response = self.login(self.alice_token.key, username='bob', password='bob-pass-123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['token'], Token.objects.get(user=self.bob).key)
+
+    def test_revoked_token_with_credentials(self):
+        revoked = self.alice_token.key
+        self.alice_token.delete()
+        response = self.login(revoked, username='alice', password='alice-pass-123')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['token'], Token.objects.get(user=self.alice).key)
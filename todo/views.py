@@ -1,17 +1,28 @@
+# importing python
+from hashlib import md5
+
 # importing django
-from django.contrib.auth.models import User
+from django.db.models import Count, Max
+from django.http import Http404, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
 
 # importing rest_framework
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication, BasicAuthentication
+from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 
+# importing authentication and renderers
+from .authentication import OptionalTokenAuthentication
+from .renderers import ORJSONRenderer
+
 # importing models
 from .models import Task, Category
 
@@ -19,10 +30,37 @@ from .models import Task, Category
 from .serializers import (
     UserRegisterSerializer,
     CategorySerializer, 
-    TaskSerializer, TaskCreateSerializer, 
+    TaskSerializer, TaskCreateSerializer, TaskFilterSerializer,
 )
 
 
+# number of tasks fetched from the database per round trip when streaming
+TASK_STREAM_CHUNK_SIZE = 500
+
+
+def list_etag(request: Request, queryset, *timestamp_fields) -> str:
+    """
+    Build an ETag for a list from its row count and latest modification times.
+
+    The count catches deletions, the timestamps catch inserts and updates.
+    The negotiated format is included so JSON and browsable API responses
+    never share a tag.
+
+    Args:
+        request (Request): The request the list is rendered for.
+        queryset: The filtered queryset the list is built from.
+        *timestamp_fields: Fields whose latest value changes when the list does.
+
+    Returns:
+        str: A quoted ETag.
+    """
+    aggregates = {f'latest_{index}': Max(field) for index, field in enumerate(timestamp_fields)}
+    values = queryset.aggregate(count=Count('pk'), **aggregates)
+    parts = [request.accepted_renderer.format, *values.values()]
+    digest = md5('-'.join(str(part) for part in parts).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
 class UserRegistrationView(APIView):
     """
     API view for user registration.
@@ -52,12 +90,12 @@ class UserRegistrationView(APIView):
         if serializer.is_valid():
             user = serializer.save()
             # Create a token for the newly registered user
-            token, created = Token.objects.get_or_create(user=user)
+            token = Token.objects.create(user=user)
             return Response({'token': token.key, 'message': 'User registered successfully'}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class UserLoginView(APIView):
+class UserLoginView(ObtainAuthToken):
     """
     API view for user login.
 
@@ -65,27 +103,33 @@ class UserLoginView(APIView):
     Upon successful login, an authentication token is generated for the user.
 
     Usage:
-        To log in, send a POST request with the user's username and password.
-        Successful login will return an authentication token.
+        To log in, send a POST request with the user's username and password
+        in the request body. Successful login will return an authentication token.
 
     Note:
         Users can use the generated authentication token to authenticate and access the app's resources.
+        Credentials in the body are always checked and win over any token header.
+        A request with a valid token and no credentials gets that token back without
+        a password check; a bad or revoked token is ignored.
     """
-    authentication_classes = [BasicAuthentication]
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [OptionalTokenAuthentication]
 
-    def post(self, request):
+    def post(self, request: Request, *args, **kwargs) -> Response:
         """
-        Log in the user and generate an authentication token.
+        Log in the user and return their authentication token.
 
         Args:
-            request: The POST request containing the user's credentials.
+            request (Request): The request containing the user's credentials or token.
 
         Returns:
-            Response: A JSON response containing the authentication token upon successful login.
+            Response: A JSON response containing the authentication token.
         """
-        token, created = Token.objects.get_or_create(user=request.user)
-        return Response({'token': token.key, 'message': 'User registered successfully'}, status=status.HTTP_201_CREATED)
+        # without credentials in the body, the token already loaded by
+        # authentication is the answer; no password hash or token lookup needed
+        sent_credentials = 'username' in request.data or 'password' in request.data
+        if request.auth is not None and not sent_credentials:
+            return Response({'token': request.auth.key})
+        return super().post(request, *args, **kwargs)
 
 
 class CategoryListView(APIView):
@@ -108,19 +152,28 @@ class CategoryListView(APIView):
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
     
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
         """
         Retrieve a list of categories for the authenticated user.
 
+        Clients sending a matching If-None-Match header get an empty 304
+        response instead.
+
         Returns:
-            Response: A JSON response containing a list of categories.
+            HttpResponseBase: A JSON response containing a list of categories,
+            or a 304 response.
         """
 
         categories = Category.objects.filter(user=request.user)
-        
-        serializer = CategorySerializer(categories, many=True)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag = list_etag(request, categories, 'updated_at')
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            serializer = CategorySerializer(categories, many=True)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        patch_vary_headers(response, ['Accept'])
+        return response
 
     def post(self, request: Request) -> Response:
         """
@@ -132,7 +185,6 @@ class CategoryListView(APIView):
         Returns:
             Response: A JSON response containing the created category data.
         """
-        request.data['user'] = request.user.id
         serializer = CategorySerializer(data=request.data)
         if serializer.is_valid():
             serializer.save(user=request.user)
@@ -154,32 +206,78 @@ class TaskListView(APIView):
             Create a new task for the authenticated user.
 
     Note:
-        Tasks can be filtered by various parameters, such as category and priority.
+        Tasks can be filtered by category_id, category (exact name) and priority (exact value).
     """
     
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
     
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
         """
         Retrieve a list of tasks for the authenticated user.
 
+        The list is streamed in chunks so large task lists are never held
+        in memory all at once. Clients sending a matching If-None-Match
+        header get an empty 304 response instead.
+
         Returns:
-            Response: A JSON response containing a list of tasks.
+            HttpResponseBase: A streamed JSON response containing a list of tasks,
+            or a 304 response.
         """
         params = request.query_params
 
         category = params.get('category', False)
         priority = params.get('priority', False)
 
-        if category and priority:
-            tasks = Task.objects.filter(user=request.user, category__name__icontains=category, priority__icontains=priority)
-        else:
-            tasks = Task.objects.filter(user=request.user)
-        
-        serializer = TaskSerializer(tasks, many=True)
+        filters = TaskFilterSerializer(data=params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+        category_id = filters.validated_data.get('category_id')
+
+        tasks = Task.objects.filter(user=request.user)
+        # exact matches so the (user, category) and (user, priority) indexes apply
+        if category_id is not None:
+            tasks = tasks.filter(category_id=category_id)
+        if category:
+            tasks = tasks.filter(category__name=category)
+        if priority:
+            tasks = tasks.filter(priority=priority)
+
+        # category names are part of the output, so renaming one changes the list too
+        etag = list_etag(request, tasks, 'updated_at', 'category__updated_at')
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            # the list has a fixed flat shape, so read plain rows instead of
+            # running every task through TaskSerializer
+            rows = tasks.values('id', 'title', 'description', 'priority', 'category__name', 'due_date', 'completed')
+            response = StreamingHttpResponse(self.stream_tasks(rows), content_type='application/json', status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+    @staticmethod
+    def stream_tasks(rows):
+        """
+        Yield a JSON array of tasks, one element at a time.
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        Args:
+            rows: A values() queryset of tasks.
+        """
+        renderer = ORJSONRenderer()
+        yield b'['
+        for index, row in enumerate(rows.iterator(chunk_size=TASK_STREAM_CHUNK_SIZE)):
+            if index:
+                yield b','
+            yield renderer.render({
+                'id': row['id'],
+                'title': row['title'],
+                'description': row['description'],
+                'priority': row['priority'],
+                'category': row['category__name'],
+                'due_date': row['due_date'],
+                'completed': row['completed']
+            })
+        yield b']'
 
     def post(self, request: Request) -> Response:
         """
@@ -191,7 +289,6 @@ class TaskListView(APIView):
         Returns:
             Response: A JSON response containing the created task data.
         """
-        request.data['user'] = request.user.id
         serializer = TaskCreateSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             serializer.save(user=request.user)
@@ -233,7 +330,7 @@ class TaskDetailView(APIView):
         Returns:
             Response: A JSON response containing the task details.
         """
-        task = get_object_or_404(Task, id=pk, user=request.user)
+        task = get_object_or_404(Task.objects.select_related('category'), id=pk, user=request.user)
         
         serializer = TaskSerializer(task)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -249,7 +346,10 @@ class TaskDetailView(APIView):
         Returns:
             Response: A JSON response containing the updated task details.
         """
-        task = get_object_or_404(Task, id=pk, user=request.user)
+        # title, description, priority and category are required, so PUT always
+        # overwrites them; load only what the response may read back unchanged.
+        # save() skips deferred fields, so updated_at must be loaded to be bumped
+        task = get_object_or_404(Task.objects.only('id', 'user_id', 'due_date', 'completed', 'updated_at'), id=pk, user=request.user)
 
         serializer = TaskSerializer(task, data=request.data)
         if serializer.is_valid():
@@ -268,7 +368,8 @@ class TaskDetailView(APIView):
         Returns:
             Response: A JSON response containing the deleted message.
         """
-        task = get_object_or_404(Task, id=pk, user=request.user)
-
-        task.delete()
+        # delete in a single query; nothing deleted means no such task for the user
+        deleted, _ = Task.objects.filter(id=pk, user=request.user).delete()
+        if not deleted:
+            raise Http404
         return Response({"message": "Task has been deleted successfully."})